@@ -18,125 +18,236 @@ from bpy.props import StringProperty, BoolProperty, EnumProperty, FloatProperty
 from bpy.types import Operator, AddonPreferences, FileHandler
 from bpy_extras.io_utils import ExportHelper, ImportHelper
 import os
+import sys
 import subprocess
-import tempfile
+import shutil
 import logging
 import traceback
 import winreg
 import re
+import atexit
+import time
+import threading
+import uuid
+import hashlib
+import string
 
 # Global constants
 cache_dir = os.path.join(os.path.expanduser("~"), "Documents", "blender_3dsmax_cache")
-if not os.path.exists(cache_dir):
-    os.makedirs(cache_dir)
+
+def ensure_cache_dir():
+    """Create the cache directory on first use (not at addon load) and return its path"""
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def _file_size(path):
+    """Size of path in bytes from a single stat call, or 0 if it does not exist"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+# Raw writes: binary on Windows (no newline translation) and never inherited by child processes
+_WRITE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC |
+                getattr(os, 'O_BINARY', 0) | getattr(os, 'O_NOINHERIT', 0))
+
+def _write_bytes(path, data):
+    """Write data to path with os.open/os.write, bypassing Python's buffered text layer"""
+    fd = os.open(path, _WRITE_FLAGS)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def cleanup_stale_exports(max_age=3600):
+    """Remove export work folders left behind by a crash or forced quit"""
+    try:
+        entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+    cutoff = time.time() - max_age
+    for entry in entries:
+        try:
+            if entry.name.startswith("export_") and entry.is_dir() and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        except OSError:
+            pass
 
 # Logging setup
 log_file = os.path.join(os.path.expanduser("~"), "Documents", "blender_3dsmax_log.txt")
 log_dir = os.path.dirname(log_file)
 
-try:
-    if not os.path.exists(log_dir):
+# Console output is set up at import; the log file is only opened once the addon is used
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+for _handler in list(logger.handlers):  # Addon reloads re-run this module
+    logger.removeHandler(_handler)
+    _handler.close()
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(_log_formatter)
+logger.addHandler(_console_handler)
+_file_handler = None
+
+def ensure_logging():
+    """Attach the log file handler on first use"""
+    global _file_handler
+    if _file_handler is not None:
+        return
+    try:
         os.makedirs(log_dir, exist_ok=True)
-    
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, mode='a', encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
-    logger = logging.getLogger(__name__)
-    
-except Exception as e:
-    print(f"Warning: Could not set up logging: {e}")
-    import sys
-    logger = logging.getLogger(__name__)
-    logger.addHandler(logging.StreamHandler(sys.stdout))
-    logger.setLevel(logging.INFO)
-
-if log_dir and not os.path.exists(log_dir): # Log if creation might have been an issue
-    logger.info(f"Log directory {log_dir} might not have been created if an error occurred earlier.")
-else:
-    logger.info(f"Logging to: {log_file}")
+        _file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+        _file_handler.setFormatter(_log_formatter)
+        logger.addHandler(_file_handler)
+        logger.info(f"Logging to: {log_file}")
+    except Exception as e:
+        # Don't retry on every operation; keep logging to the console only
+        _file_handler = logging.NullHandler()
+        logger.warning(f"Could not set up logging to {log_file}: {e}")
+
+# Registry version key formats like "25.0", "26.0", "2025", "2026" etc.
+_VER_RE = re.compile(r'^(\d+)(?:\.(\d+))?$')
+
+# Registry roots that may hold 3ds Max installations
+_MAX_REGISTRY_PATHS = (
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Autodesk\3dsMax"),
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Autodesk\3dsMax"),
+    (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Autodesk\3dsMax"),
+)
+
+# Possible Python executable locations relative to the 3ds Max install directory
+_PY_CANDIDATES = (
+    ("Python", "python.exe"),
+    ("bin", "python.exe"),
+    ("Python37", "python.exe"),
+    ("Python39", "python.exe"),
+)
+
+def _max_version_number(version_key):
+    """Comparable version for a registry key: year formats like "2025" map to 25, "25.0" stays 25.0"""
+    if len(version_key) == 4 and version_key.isdigit() and int(version_key) >= 2020:
+        return int(version_key) - 2000
+    return float(version_key)
 
 def detect_max_python_path():
     """Detect the highest version 3ds Max Python path through registry"""
     try:
-        max_installations = {}
-        
-        # Check common registry paths
-        registry_paths = [
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Autodesk\3dsMax"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Autodesk\3dsMax"),
-            (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Autodesk\3dsMax"),
-        ]
-        
-        for hkey, base_path in registry_paths:
+        # Collect every version key first; only the highest usable one gets probed further
+        version_keys = []
+        for hkey, base_path in _MAX_REGISTRY_PATHS:
             try:
                 with winreg.OpenKey(hkey, base_path) as key:
-                    i = 0
-                    while True:
-                        try:
-                            version_key = winreg.EnumKey(key, i)
-                            # Match version number formats like "25.0", "26.0", "2025", "2026" etc.
-                            version_match = re.match(r'^(\d+)(?:\.(\d+))?$', version_key)
-                            if version_match:
-                                # Handle different version number formats
-                                if '.' in version_key:
-                                    version_num = float(version_key)
-                                else:
-                                    # For year formats like "2025", convert to version number
-                                    year = int(version_key)
-                                    if year >= 2020:
-                                        version_num = year - 2000  # 2025 -> 25.0
-                                    else:
-                                        version_num = float(version_key)
-                                
-                                try:
-                                    with winreg.OpenKey(key, version_key) as ver_key:
-                                        install_path, _ = winreg.QueryValueEx(ver_key, "Installdir")
-                                        if install_path and os.path.exists(install_path):
-                                            # Check multiple possible Python path locations
-                                            python_paths = [
-                                                os.path.join(install_path, "Python", "python.exe"),
-                                                os.path.join(install_path, "bin", "python.exe"),
-                                                os.path.join(install_path, "Python37", "python.exe"),
-                                                os.path.join(install_path, "Python39", "python.exe"),
-                                            ]
-                                            
-                                            for python_path in python_paths:
-                                                if os.path.exists(python_path):
-                                                    max_installations[version_num] = {
-                                                        'path': install_path,
-                                                        'python_path': python_path,
-                                                        'version': version_key
-                                                    }
-                                                    logger.info(f"Found 3ds Max {version_key} at: {install_path}")
-                                                    break
-                                except Exception as e:
-                                    logger.debug(f"Error reading version {version_key}: {e}")
-                            i += 1
-                        except OSError:
-                            break
+                    subkey_count = winreg.QueryInfoKey(key)[0]
+                    for i in range(subkey_count):
+                        version_key = winreg.EnumKey(key, i)
+                        if _VER_RE.match(version_key):
+                            version_keys.append((_max_version_number(version_key), hkey, base_path, version_key))
             except Exception as e:
                 logger.debug(f"Error accessing registry path {base_path}: {e}")
         
-        # Return the highest version Python path
-        if max_installations:
-            latest_version = max(max_installations.keys())
-            latest_install = max_installations[latest_version]
-            logger.info(f"Selected 3ds Max {latest_install['version']} (highest version found)")
-            return latest_install['python_path']
-        else:
-            logger.warning("No 3ds Max installations found in registry")
-            return ""
+        # Probe from the highest version down and stop at the first working install
+        version_keys.sort(key=lambda entry: entry[0], reverse=True)
+        for _, hkey, base_path, version_key in version_keys:
+            try:
+                with winreg.OpenKey(hkey, f"{base_path}\\{version_key}") as ver_key:
+                    install_path, _ = winreg.QueryValueEx(ver_key, "Installdir")
+            except Exception as e:
+                logger.debug(f"Error reading version {version_key}: {e}")
+                continue
+            if not install_path:
+                continue
+            # One directory listing tells us which candidate folders exist
+            try:
+                with os.scandir(install_path) as entries:
+                    subdirs = {entry.name.lower() for entry in entries if entry.is_dir()}
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            except OSError as e:
+                logger.debug(f"Cannot list {install_path}, probing candidates directly: {e}")
+                subdirs = None
+            for candidate in _PY_CANDIDATES:
+                if subdirs is not None and candidate[0].lower() not in subdirs:
+                    continue
+                python_path = os.path.join(install_path, *candidate)
+                if os.path.isfile(python_path):
+                    logger.info(f"Found 3ds Max {version_key} at: {install_path}")
+                    logger.info(f"Selected 3ds Max {version_key} (highest version found)")
+                    return python_path
+        
+        logger.warning("No 3ds Max installations found in registry")
+        return ""
             
     except Exception as e:
         logger.error(f"Error detecting 3ds Max from registry: {e}")
         return ""
 
+# Cached result of the last registry scan (None until the first scan)
+_detected_max_python_path = None
+
+def get_max_python_path(force=False):
+    """Return the detected 3ds Max Python path, rescanning the registry only on first use or when forced"""
+    global _detected_max_python_path
+    if force or _detected_max_python_path is None:
+        _detected_max_python_path = detect_max_python_path()
+    return _detected_max_python_path
+
+# Short-lived os.path.exists results for paths shown in the UI: {path: (checked_at, exists)}
+_path_exists_cache = {}
+_PATH_EXISTS_TTL = 2.0
+
+def _cached_path_exists(path):
+    """os.path.exists with a few seconds of caching, for use from draw callbacks"""
+    now = time.monotonic()
+    cached = _path_exists_cache.get(path)
+    if cached and now - cached[0] < _PATH_EXISTS_TTL:
+        return cached[1]
+    exists = os.path.exists(path)
+    _path_exists_cache[path] = (now, exists)
+    return exists
+
+def _on_max_python_path_update(self, context):
+    """Re-check the new path on the next redraw instead of showing a stale status"""
+    _path_exists_cache.clear()
+    _max_env_settings.clear()
+
+def _on_keep_max_running_update(self, context):
+    """Shut the background 3ds Max down as soon as the user stops asking to keep it"""
+    if not self.keep_max_running:
+        _stop_max_worker()
+
+# Import operator options that mirror a "default_<name>" addon preference
+_IMPORT_DEFAULT_KEYS = (
+    "import_models", "import_lights", "import_cameras", "import_splines",
+    "import_animations", "import_materials", "import_armatures",
+    "apply_rotation", "apply_scale",
+)
+
+def _apply_import_defaults(operator, preferences):
+    """Copy the default import options from the addon preferences onto an import operator"""
+    for key in _IMPORT_DEFAULT_KEYS:
+        setattr(operator, key, getattr(preferences, "default_" + key))
+
+def _deselect_all(context):
+    """Deselect objects without the select_all operator; only the current selection is visited"""
+    for obj in context.selected_objects:
+        obj.select_set(False)
+
+def _auto_detect_preferences_path():
+    """Fill in the 3ds Max Python path preference once if it is still empty"""
+    try:
+        preferences = bpy.context.preferences.addons[__name__].preferences
+    except (KeyError, AttributeError) as e:
+        logger.debug(f"Addon preferences not available for auto-detection: {e}")
+        return
+    if not preferences.max_python_path:
+        detected_path = get_max_python_path()
+        if detected_path:
+            preferences.max_python_path = detected_path
+            logger.info(f"Auto-detected 3ds Max Python path on registration: {detected_path}")
+
 class PREFERENCES_OT_detect_max_python(Operator):
     """Auto-detect 3ds Max Python path"""
     bl_idname = "preferences.detect_max_python"
@@ -144,8 +255,9 @@ class PREFERENCES_OT_detect_max_python(Operator):
     bl_description = "Automatically detect the highest version 3ds Max Python path from registry"
     
     def execute(self, context):
+        ensure_logging()
         preferences = context.preferences.addons[__name__].preferences
-        detected_path = detect_max_python_path()
+        detected_path = get_max_python_path(force=True)
         
         if detected_path:
             preferences.max_python_path = detected_path
@@ -164,20 +276,18 @@ class MaxPreferences(AddonPreferences):
         name="3ds Max Python Path",
         description="Path to 3ds Max's Python executable (python.exe)",
         subtype='FILE_PATH',
-        default="" # Will be auto-detected
+        default="", # Will be auto-detected
+        update=_on_max_python_path_update
+    )
+    keep_max_running: BoolProperty(
+        name="Keep 3ds Max Running",
+        description="Reuse one background 3ds Max batch process for all imports and exports in this session instead of starting 3ds Max for every operation. Turning this off stops the background process",
+        default=False,
+        update=_on_keep_max_running_update
     )
     
     def __init__(self):
         super().__init__()
-        
-    def draw_header(self, context):
-        """Auto-detect path when preferences are first opened"""
-        if not hasattr(self, '_auto_detected') and not self.max_python_path:
-            detected_path = detect_max_python_path()
-            if detected_path:
-                self.max_python_path = detected_path
-                logger.info(f"Auto-detected 3ds Max Python path on first open: {detected_path}")
-            self._auto_detected = True
     
     # Import default settings
     default_import_models: BoolProperty(
@@ -227,9 +337,6 @@ class MaxPreferences(AddonPreferences):
     )
 
     def draw(self, context):
-        # Auto-detect path on first open
-        self.draw_header(context)
-        
         layout = self.layout
         
         # 3ds Max Python path setting
@@ -239,7 +346,7 @@ class MaxPreferences(AddonPreferences):
         
         # Display detection status
         if self.max_python_path:
-            if os.path.exists(self.max_python_path):
+            if _cached_path_exists(self.max_python_path):
                 status_row = layout.row()
                 status_row.label(text="✓ Path Valid", icon='CHECKMARK')
             else:
@@ -252,6 +359,7 @@ class MaxPreferences(AddonPreferences):
         # Information hint
         info_box = layout.box()
         info_box.label(text="Uses 3ds Max Python to call MAXScript for file conversion", icon='INFO')
+        layout.prop(self, "keep_max_running", icon='LINKED')
         
         layout.separator()
         
@@ -271,6 +379,443 @@ class MaxPreferences(AddonPreferences):
         import_col.prop(self, "default_apply_rotation", icon='CON_ROTLIKE')
         import_col.prop(self, "default_apply_scale", icon='CON_SIZELIKE')
 
+def _ms_string(value):
+    """Quoted MAXScript string literal for value, with backslashes and quotes escaped"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+# MAXScript reader for the raw mesh file written by ExportMax._write_mesh_transfer:
+# int32 mesh count, then per mesh a null-terminated UTF-8 name, int32 vertex and
+# triangle counts, float32 xyz positions in meters and int32 zero-based triangle indices.
+_MAX_MESH_LOADER = """
+fn blenderLoadMeshes meshPath =
+(
+    local unitScale = units.decodeValue "1m"
+    local f = fopen meshPath "rb"
+    if f == undefined then throw ("Cannot open mesh file: " + meshPath)
+    local meshCount = ReadLong f #signed
+    for m = 1 to meshCount do
+    (
+        local meshName = ReadString f
+        local numVerts = ReadLong f #signed
+        local numFaces = ReadLong f #signed
+        local verts = for i = 1 to numVerts collect
+        (
+            local x = ReadFloat f
+            local y = ReadFloat f
+            local z = ReadFloat f
+            [x, y, z] * unitScale
+        )
+        local faces = for i = 1 to numFaces collect
+        (
+            local a = ReadLong f #signed
+            local b = ReadLong f #signed
+            local c = ReadLong f #signed
+            [a + 1, b + 1, c + 1]
+        )
+        local newMesh = mesh vertices:verts faces:faces
+        newMesh.name = meshName
+    )
+    fclose f
+    meshCount
+)
+"""
+
+# MAXScript run by the persistent 3dsmaxbatch worker. Jobs are three-line UTF-8 files
+# (command, source path, target path) dropped into the job directory; each gets a
+# matching .result file containing "OK" or "ERR <message>".
+_MAX_WORKER_SCRIPT = string.Template(_MAX_MESH_LOADER + """
+jobDir = $job_dir
+format "[MAX_WORKER_LOG] Worker started, watching: %\\n" jobDir
+running = true
+while running do
+(
+    jobFiles = getFiles (jobDir + "\\\\*.job")
+    if jobFiles.count == 0 then sleep 0.1
+    else for jobFile in jobFiles while running do
+    (
+        resultLine = "OK"
+        f = undefined
+        -- Reading the job is inside the try too, so one bad job file cannot end the worker
+        try
+        (
+            f = openFile jobFile mode:"r" encoding:#utf8
+            if f == undefined then throw ("Cannot open job file: " + jobFile)
+            command = readLine f
+            sourcePath = readLine f
+            targetPath = readLine f
+            close f
+            f = undefined
+            deleteFile jobFile
+            format "[MAX_WORKER_LOG] % % -> %\\n" command sourcePath targetPath
+            case command of
+            (
+                "EXPORT": (
+                    resetMaxFile #noPrompt
+                    importFile sourcePath #noPrompt
+                    saveMaxFile targetPath quiet:true
+                )
+                "MESHES": (
+                    resetMaxFile #noPrompt
+                    blenderLoadMeshes sourcePath
+                    saveMaxFile targetPath quiet:true
+                )
+                "IMPORT": (
+                    loadMaxFile sourcePath quiet:true
+                    exportFile targetPath #noPrompt selectedOnly:false
+                )
+                "QUIT": running = false
+                default: resultLine = "ERR Unknown command: " + command
+            )
+        )
+        catch
+        (
+            resultLine = "ERR " + (getCurrentException())
+            if f != undefined do try (close f) catch ()
+            deleteFile jobFile
+        )
+        try
+        (
+            resultFile = (getFilenamePath jobFile) + (getFilenameFile jobFile) + ".result"
+            out = createFile (resultFile + ".tmp") encoding:#utf8
+            format "%\\n" resultLine to:out
+            close out
+            renameFile (resultFile + ".tmp") resultFile
+        )
+        catch
+        (
+            format "[MAX_WORKER_LOG] Could not write result for %: %\\n" jobFile (getCurrentException())
+        )
+    )
+)
+quitMax exitCode:0
+""")
+
+
+# MAXScript run by a one-off 3dsmaxbatch export, see ExportMax._generate_maxscript
+_MAX_EXPORT_SCRIPT = string.Template(_MAX_MESH_LOADER + """
+fn blenderAlive pid =
+(
+    try ( not ((dotNetClass "System.Diagnostics.Process").GetProcessById pid).HasExited ) catch ( false )
+)
+format "[MAX_EXPORT_LOG] 3ds Max started, waiting for FBX: %\\n" $fbx_path
+fbxReady = false
+waiting = true
+polls = 0
+while waiting do
+(
+    -- About once a second, give up if Blender crashed or was killed before handing over the FBX
+    if doesFileExist $ready_flag then ( fbxReady = true; waiting = false )
+    else if ((mod polls 20) == 0) and not (blenderAlive $blender_pid) then
+    (
+        format "[MAX_EXPORT_LOG] Blender process % is gone, giving up\\n" $blender_pid
+        waiting = false
+    )
+    else ( sleep 0.05; polls += 1 )
+)
+if fbxReady then
+(
+    resetMaxFile #noPrompt
+    if doesFileExist $mesh_path then blenderLoadMeshes $mesh_path else importFile $fbx_path #noPrompt
+    saveMaxFile $target_path quiet:true
+    format "[MAX_EXPORT_LOG] Saved 3ds Max file: %\\n" $target_path
+    quitMax exitCode:0
+) else quitMax exitCode:1
+""")
+
+# Python launcher run by 3ds Max Python for a one-off import:
+#   max_python.exe launcher.py <source .max> <target .fbx>
+# It converts the .max file to FBX through 3dsmaxbatch in the same install.
+_MAX_IMPORT_LAUNCHER = r'''
+import os
+import sys
+import subprocess
+import tempfile
+
+def ms_string(value):
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+print("[MAX_IMPORT_LOG] 3ds Max Script Start (Import Process)")
+
+max_input_path, fbx_output_path = sys.argv[1], sys.argv[2]
+
+print(f"[MAX_IMPORT_LOG] Source: {max_input_path}, Target FBX: {fbx_output_path}")
+
+if not os.path.exists(max_input_path):
+    print(f"[MAX_IMPORT_ERROR] Input 3ds Max file not found: {max_input_path}")
+    sys.exit(1)
+
+try:
+    # Find 3dsmaxbatch.exe from Python path
+    max_python_dir = os.path.dirname(sys.executable)
+    max_root = os.path.dirname(max_python_dir)
+    max_batch = os.path.join(max_root, "3dsmaxbatch.exe")
+    
+    if not os.path.exists(max_batch):
+        print(f"[MAX_IMPORT_ERROR] 3dsmaxbatch.exe not found at: {max_batch}")
+        sys.exit(1)
+    
+    print(f"[MAX_IMPORT_LOG] Using 3dsmaxbatch.exe: {max_batch}")
+
+    # Create MAXScript file
+    maxscript_content = (
+        f"loadMaxFile {ms_string(max_input_path)} quiet:true\n"
+        f"exportFile {ms_string(fbx_output_path)} #noPrompt selectedOnly:false\n"
+        "quitMax exitCode:0\n"
+    )
+
+    # Write temporary MAXScript file
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.ms', delete=False, encoding='utf-8') as f:
+        f.write(maxscript_content)
+        script_path = f.name
+    
+    print(f"[MAX_IMPORT_LOG] Created MaxScript: {script_path}")
+
+    try:
+        # Execute 3dsmaxbatch with the script; its output goes straight to our own stdout
+        sys.stdout.flush()
+        result = subprocess.run([max_batch, script_path], stderr=subprocess.STDOUT, timeout=300,
+                                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
+        
+        print(f"[MAX_IMPORT_LOG] 3dsmaxbatch executed with return code: {result.returncode}")
+        
+        try:
+            file_size = os.stat(fbx_output_path).st_size
+        except OSError:
+            file_size = 0
+        if file_size > 0:
+            print(f"[MAX_IMPORT_LOG] FBX file exported: {fbx_output_path} (Size: {file_size} B)")
+        else:
+            print(f"[MAX_IMPORT_ERROR] FBX export failed or file is empty: {fbx_output_path}")
+            sys.exit(1)
+    
+    finally:
+        try:
+            os.unlink(script_path)
+        except:
+            pass
+            
+except subprocess.TimeoutExpired:
+    print(f"[MAX_IMPORT_ERROR] 3dsmaxbatch execution timed out")
+    sys.exit(1)
+except Exception as e:
+    print(f"[MAX_IMPORT_ERROR] Error during conversion: {str(e)}")
+    sys.exit(1)
+
+print("[MAX_IMPORT_LOG] 3ds Max Script End (Import Process)")
+'''
+
+def get_import_launcher_path():
+    """Write the import launcher into the cache once; the name is keyed by its content"""
+    digest = hashlib.sha1(_MAX_IMPORT_LAUNCHER.encode('utf-8')).hexdigest()[:12]
+    launcher_path = os.path.join(ensure_cache_dir(), f"max_to_fbx_launcher_{digest}.py")
+    if not os.path.isfile(launcher_path):
+        tmp_path = f"{launcher_path}.{uuid.uuid4().hex}.tmp"
+        _write_bytes(tmp_path, _MAX_IMPORT_LAUNCHER.encode('utf-8'))
+        os.replace(tmp_path, launcher_path)
+    return launcher_path
+
+
+# 3dsmaxbatch.exe location for each configured 3ds Max Python path
+_max_batch_paths = {}
+
+def get_max_batch_path(max_python_path):
+    """3dsmaxbatch.exe of the 3ds Max install that owns max_python_path"""
+    max_batch = _max_batch_paths.get(max_python_path)
+    if max_batch is None:
+        max_root = os.path.dirname(os.path.dirname(max_python_path))
+        max_batch = _max_batch_paths[max_python_path] = os.path.join(max_root, "3dsmaxbatch.exe")
+    return max_batch
+
+
+# Environment settings for each configured 3ds Max Python path: (fixed values, PATH-style prefixes)
+_max_env_settings = {}
+
+def _get_max_env_settings(max_python_path):
+    settings = _max_env_settings.get(max_python_path)
+    if settings is None:
+        max_bin_path = os.path.dirname(max_python_path)
+        max_location = os.path.dirname(max_bin_path)
+        fixed = {
+            "ADSK_3DSMAX_x64_2026": max_location,
+            "ADSK_3DSMAX_PLUGINS_PATH": os.path.join(max_location, 'plugins'),
+            "ADSK_3DSMAX_SCRIPTS_PATH": os.path.join(max_location, 'scripts'),
+            "PYTHONIOENCODING": "UTF-8",
+        }
+        prefixes = {"PATH": max_bin_path}
+        python_site_packages = os.path.join(max_location, 'Python', 'Lib', 'site-packages')
+        if os.path.exists(python_site_packages):
+            prefixes["PYTHONPATH"] = python_site_packages
+        settings = _max_env_settings[max_python_path] = (fixed, prefixes)
+    return settings
+
+def build_max_env(max_python_path):
+    """Environment for 3ds Max child processes: the current environment plus the install's settings"""
+    fixed, prefixes = _get_max_env_settings(max_python_path)
+    env = os.environ.copy()
+    env.update(fixed)
+    for key, prefix in prefixes.items():
+        env[key] = f"{prefix}{os.pathsep}{env.get(key, '')}"
+    return env
+
+
+def _hidden_window_options():
+    """Popen keyword arguments that keep 3ds Max console windows from being created on Windows"""
+    if sys.platform != 'win32':
+        return {}
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = 0  # SW_HIDE
+    return {'startupinfo': startupinfo, 'creationflags': subprocess.CREATE_NO_WINDOW}
+
+def _start_logged_process(args, env, label):
+    """Popen with stdout and stderr merged and streamed line by line into the log.
+
+    A daemon thread drains the pipe while the caller waits, so output shows up
+    live and a verbose child can never block on a full pipe buffer. Wait for the
+    process with _wait_logged_process so its last lines are logged in order.
+    """
+    process = subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1,
+        text=True, encoding='utf-8', errors='replace', env=env, **_hidden_window_options()
+    )
+    process.output_thread = threading.Thread(target=_log_process_output, args=(process, label), daemon=True)
+    process.output_thread.start()
+    return process
+
+def _wait_logged_process(process, timeout=None, drain_timeout=5):
+    """Wait for a process from _start_logged_process and for the reader to log its remaining output"""
+    return_code = process.wait(timeout=timeout)
+    # A grandchild that inherited the pipe can keep it open; never hang on it
+    process.output_thread.join(timeout=drain_timeout)
+    return return_code
+
+def _log_process_output(process, label):
+    for line in process.stdout:
+        line = line.rstrip()
+        if line: logger.info(f"{label}: {line}")
+
+
+class MaxBatchWorker:
+    """Long-lived 3dsmaxbatch.exe process that converts files without restarting 3ds Max"""
+    
+    def __init__(self, max_python_path):
+        self.max_python_path = max_python_path
+        self.max_batch = get_max_batch_path(max_python_path)
+        # Per Blender process, so workers of concurrent sessions never see each other's jobs
+        self.job_dir = os.path.join(cache_dir, f"max_worker_jobs_{os.getpid()}")
+        self.script_path = os.path.join(cache_dir, f"max_worker_{os.getpid()}.ms")
+        self.process = None
+    
+    def is_running(self):
+        return self.process is not None and self.process.poll() is None
+    
+    def start(self, env):
+        """Launch 3dsmaxbatch with the worker script if it is not already running"""
+        if self.is_running():
+            return
+        if not os.path.exists(self.max_batch):
+            raise RuntimeError(f"3dsmaxbatch.exe not found at: {self.max_batch}")
+        
+        os.makedirs(self.job_dir, exist_ok=True)  # Also creates cache_dir on first use
+        # Drop jobs and results left over from a previous worker
+        for name in os.listdir(self.job_dir):
+            try: os.remove(os.path.join(self.job_dir, name))
+            except OSError: pass
+        
+        worker_script = _MAX_WORKER_SCRIPT.substitute(job_dir=_ms_string(self.job_dir))
+        _write_bytes(self.script_path, worker_script.encode('utf-8'))
+        
+        logger.info(f"Starting persistent 3ds Max worker: {self.max_batch}")
+        self.process = _start_logged_process([self.max_batch, self.script_path], env, "3ds Max Worker")
+    
+    def _submit(self, command, source_path="", target_path=""):
+        """Write a job file atomically so the worker never reads a partial job"""
+        job_name = uuid.uuid4().hex
+        tmp_path = os.path.join(self.job_dir, job_name + ".tmp")
+        _write_bytes(tmp_path, f"{command}\n{source_path}\n{target_path}\n".encode('utf-8'))
+        os.replace(tmp_path, os.path.join(self.job_dir, job_name + ".job"))
+        return job_name
+    
+    def run_job(self, command, source_path, target_path, timeout=300):
+        """Queue a job and wait for it. Returns (ok, message); raises RuntimeError if the worker is unusable"""
+        if not self.is_running():
+            raise RuntimeError("3ds Max worker is not running")
+        
+        job_name = self._submit(command, source_path, target_path)
+        result_path = os.path.join(self.job_dir, job_name + ".result")
+        
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(result_path):
+            if not self.is_running():
+                raise RuntimeError(f"3ds Max worker exited (RC: {self.process.returncode})")
+            if time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError(f"3ds Max worker timed out after {timeout}s")
+            time.sleep(0.1)
+        
+        with open(result_path, 'r', encoding='utf-8-sig') as f:
+            result = f.read().strip()
+        try: os.remove(result_path)
+        except OSError: pass
+        
+        if result == "OK":
+            return True, ""
+        return False, result[4:] if result.startswith("ERR ") else result
+    
+    def stop(self, timeout=10):
+        if self.is_running():
+            try:
+                self._submit("QUIT")
+                _wait_logged_process(self.process, timeout=timeout)
+            except Exception:
+                self.process.kill()
+                _wait_logged_process(self.process)
+            logger.info("Persistent 3ds Max worker stopped.")
+        self.process = None
+        # The job folder and script belong to this session only
+        shutil.rmtree(self.job_dir, ignore_errors=True)
+        try: os.remove(self.script_path)
+        except OSError: pass
+
+
+_max_worker = None
+
+def _start_max_worker(max_python_path, env):
+    """Make sure a worker for this 3ds Max install is running; raises on failure"""
+    global _max_worker
+    if _max_worker is not None and _max_worker.max_python_path != max_python_path:
+        _max_worker.stop()
+        _max_worker = None
+    if _max_worker is None:
+        _max_worker = MaxBatchWorker(max_python_path)
+    _max_worker.start(env)
+
+def _run_max_worker_job(max_python_path, env, command, source_path, target_path):
+    """Run a conversion in the persistent worker.
+
+    Returns True/False for the job outcome, or None if the worker could not be used
+    and the caller should fall back to a one-off 3ds Max run.
+    """
+    try:
+        _start_max_worker(max_python_path, env)
+        ok, message = _max_worker.run_job(command, source_path, target_path)
+    except Exception as e:
+        logger.warning(f"Persistent 3ds Max worker unavailable, falling back to a one-off run: {e}")
+        return None
+    
+    if not ok:
+        logger.error(f"3ds Max worker {command} job failed: {message}")
+    return ok
+
+def _stop_max_worker():
+    global _max_worker
+    if _max_worker is not None:
+        _max_worker.stop()
+        _max_worker = None
+
+# Blender does not always unregister addons on quit; never leave 3ds Max running behind it
+atexit.register(_stop_max_worker)
+
 
 class ExportMax(Operator, ExportHelper):
     bl_idname = "export_scene.max"
@@ -292,6 +837,21 @@ class ExportMax(Operator, ExportHelper):
         description="Export selected objects only",
         default=False
     )
+    apply_modifiers: BoolProperty(
+        name="Apply Modifiers",
+        description="Apply mesh modifiers to exported geometry (disable for faster export of modifier-free scenes)",
+        default=True
+    )
+    copy_textures: BoolProperty(
+        name="Copy Textures",
+        description="Copy referenced texture files alongside the intermediate FBX",
+        default=True
+    )
+    direct_mesh_transfer: BoolProperty(
+        name="Direct Mesh Transfer",
+        description="Send mesh-only exports without animation to 3ds Max as raw triangles instead of FBX (geometry only, no materials or UVs)",
+        default=False
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -308,8 +868,12 @@ class ExportMax(Operator, ExportHelper):
         
         layout.separator()
         layout.prop(self, "use_selection")
+        layout.prop(self, "apply_modifiers")
+        layout.prop(self, "copy_textures")
+        layout.prop(self, "direct_mesh_transfer")
     
     def execute(self, context):
+        ensure_logging()
         if not self.filepath:
             self.report({'ERROR'}, "No filepath specified")
             return {'CANCELLED'}
@@ -339,235 +903,328 @@ class ExportMax(Operator, ExportHelper):
             self.report({'ERROR'}, "3ds Max Python executable path not set or invalid. Check Addon Preferences.")
             return {'CANCELLED'}
 
-        with tempfile.TemporaryDirectory(prefix="blender_maya_export_") as temp_dir:
-            fbx_path = os.path.join(temp_dir, "temp_export.fbx")
+        # Work inside the addon cache; one folder per export keeps copied textures together
+        try:
+            temp_dir = os.path.join(ensure_cache_dir(), f"export_{uuid.uuid4().hex}")
+            os.makedirs(temp_dir)
+        except OSError as e:
+            logger.error(f"Could not create export work folder in {cache_dir}: {e}")
+            self.report({'ERROR'}, f"Could not create cache directory: {cache_dir}")
+            return {'CANCELLED'}
+
+        try:
+            fbx_path, mesh_path, ready_flag = self._export_paths(temp_dir)
             logger.info(f"Intermediate FBX will be exported to: {fbx_path}")
-            
-            # Apply export filters and get objects to export
-            try:
-                original_selection = bpy.context.selected_objects[:]
-                original_active = bpy.context.view_layer.objects.active
-                
-                bpy.ops.object.select_all(action='DESELECT')
-                export_objects_count = 0
-                
-                # Determine source objects based on selection mode
-                if self.use_selection:
-                    source_objects = bpy.context.selected_objects if original_selection else []
-                else:
-                    source_objects = bpy.context.scene.objects
-                
-                for obj in source_objects:
-                    # Check if object is in current view layer before trying to select it
-                    if obj.name not in bpy.context.view_layer.objects:
-                        continue
-                    
-                    obj.select_set(False) 
-                    should_select = False
-                    if obj.type == 'MESH' and self.export_models: should_select = True
-                    elif obj.type == 'LIGHT' and self.export_lights: should_select = True
-                    elif obj.type == 'CAMERA' and self.export_cameras: should_select = True
-                    elif obj.type == 'CURVE' and self.export_splines: should_select = True
-                    elif obj.type == 'ARMATURE' and (self.export_models or self.export_animations): should_select = True
-                    
-                    if should_select:
-                        obj.select_set(True)
-                        export_objects_count += 1
-                
-                if export_objects_count == 0:
-                    self.report({'WARNING'}, "No objects match export filters. Nothing exported to FBX.")
-                    logger.warning("No objects matched export filters for FBX export.")
-                    # Restore selection before returning
-                    bpy.ops.object.select_all(action='DESELECT')
-                    if original_active and original_active.name in bpy.context.view_layer.objects:
-                        bpy.context.view_layer.objects.active = original_active
-                    for obj_ref in original_selection:
-                        if obj_ref and obj_ref.name in bpy.context.view_layer.objects: 
-                            obj_ref.select_set(True)
-                    return {'CANCELLED'}
+            run_env = build_max_env(max_python_path)
 
-                logger.info(f"Exporting {export_objects_count} objects to FBX based on filters.")
-            
-                # Export to FBX first
-                bpy.ops.export_scene.fbx(
-                    filepath=fbx_path,
-                    use_selection=True,  # Always use selection since we've filtered objects
-                    global_scale=1.0,
-                    apply_unit_scale=True,
-                    apply_scale_options='FBX_SCALE_NONE',
-                    object_types={'MESH', 'CURVE', 'ARMATURE', 'EMPTY', 'CAMERA', 'LIGHT'},
-                    use_mesh_modifiers=True,
-                    mesh_smooth_type='EDGE',
-                    use_subsurf=False,
-                    use_mesh_edges=False,
-                    use_tspace=False,
-                    use_custom_props=False,
-                    add_leaf_bones=True,
-                    primary_bone_axis='Y',
-                    secondary_bone_axis='X',
-                    use_armature_deform_only=False,
-                    armature_nodetype='NULL',
-                    bake_anim=self.export_animations,
-                    bake_anim_use_all_bones=True,
-                    bake_anim_use_nla_strips=True,
-                    bake_anim_use_all_actions=True,
-                    bake_anim_force_startend_keying=True,
-                    bake_anim_step=1.0,
-                    bake_anim_simplify_factor=1.0,
-                    path_mode='COPY',  # Copy textures
-                    embed_textures=False,
-                    batch_mode='OFF',
-                    use_batch_own_dir=True,
-                    use_metadata=True
-                )
-                
-                # Restore original Blender selection
-                bpy.ops.object.select_all(action='DESELECT')
-                if original_active and original_active.name in bpy.context.view_layer.objects:
-                    bpy.context.view_layer.objects.active = original_active
-                for obj_ref in original_selection:
-                    if obj_ref and obj_ref.name in bpy.context.view_layer.objects: 
-                        obj_ref.select_set(True)
-                
-                if not os.path.exists(fbx_path) or os.path.getsize(fbx_path) == 0:
-                    raise Exception("FBX export failed or resulted in empty file")
-                
-                logger.info("FBX export from Blender completed.")
+            # Select what the filters match; nothing is launched when that is empty
+            try:
+                selection = self._capture_selection()
+                export_types = self._export_object_types()
+                export_objects = self._select_export_objects(selection, export_types)
             except Exception as e:
-                logger.error(f"FBX export from Blender failed: {str(e)}")
+                logger.error(f"Applying export filters failed: {str(e)}")
                 logger.error(f"Traceback: {traceback.format_exc()}")
                 self.report({'ERROR'}, f"FBX export from Blender failed. See log: {log_file}")
                 return {'CANCELLED'}
+            if not export_objects:
+                self.report({'WARNING'}, "No objects match export filters. Nothing exported to FBX.")
+                logger.warning("No objects matched export filters for FBX export.")
+                self._restore_selection(*selection)
+                return {'CANCELLED'}
 
-            # Generate simple MAXScript calling script
-            max_script = self._generate_simple_script(fbx_path, filepath)
-            max_script_path = os.path.join(temp_dir, "blender_to_max_export_script.py")
-            with open(max_script_path, 'w', encoding='utf-8') as f:
-                f.write(max_script)
+            # Start 3ds Max now so its startup overlaps the export below
+            max_process = None
+            use_worker = preferences.keep_max_running
+            if use_worker:
+                try:
+                    _start_max_worker(max_python_path, run_env)
+                except Exception as e:
+                    logger.warning(f"Persistent 3ds Max worker unavailable, falling back to a one-off run: {e}")
+                    use_worker = False
+            if not use_worker:
+                max_process = self._launch_max_export(max_python_path, run_env, temp_dir, filepath, selection)
+                if max_process is None:
+                    return {'CANCELLED'}
 
-            logger.info(f"Running 3ds Max script for final export: {max_script_path}")
             try:
-                # Basic environment for 3ds Max Python
-                run_env = os.environ.copy() 
-                max_bin_dir = os.path.dirname(max_python_path)
-                max_root_dir = os.path.dirname(max_bin_dir) if max_bin_dir else os.path.dirname(max_python_path)
-                run_env['ADSK_3DSMAX_x64_2026'] = max_root_dir
-                run_env['PATH'] = f"{max_bin_dir}{os.pathsep}{run_env.get('PATH', '')}"
-
-                # Use Python to run the script
-                result = subprocess.run([max_python_path, max_script_path], 
-                                     check=False, # Check manually
-                                     capture_output=True, 
-                                     text=True,
-                                     env=run_env,
-                                     encoding='utf-8')
-                
-                stdout_msg = result.stdout.strip() if result.stdout else ""
-                stderr_msg = result.stderr.strip() if result.stderr else ""
-                
-                if stdout_msg: logger.info(f"3ds Max Export Script STDOUT:\n{stdout_msg}")
-                if stderr_msg: logger.error(f"3ds Max Export Script STDERR:\n{stderr_msg}")
-                
-                if result.returncode != 0:
-                    logger.error(f"Running 3ds Max export script failed. RC: {result.returncode}")
-                    self.report({'ERROR'}, f"3ds Max script execution failed (RC: {result.returncode}). See log: {log_file}")
-                    return {'CANCELLED'}
-                
-            except Exception as e_run_script:
-                logger.error(f"Error running 3ds Max export script: {str(e_run_script)}")
+                transfer_path, direct_mesh = self._write_intermediate(context, export_objects, export_types,
+                                                                      fbx_path, mesh_path)
+            except Exception as e:
+                logger.error(f"FBX export from Blender failed: {str(e)}")
                 logger.error(f"Traceback: {traceback.format_exc()}")
-                self.report({'ERROR'}, f"Failed to run 3ds Max script. See log: {log_file}")
+                self._kill_max_process(max_process)
+                self.report({'ERROR'}, f"FBX export from Blender failed. See log: {log_file}")
                 return {'CANCELLED'}
+            finally:
+                self._restore_selection(*selection)
+
+            if use_worker:
+                logger.info("Converting to 3ds Max file in the persistent 3ds Max worker.")
+                worker_ok = _run_max_worker_job(max_python_path, run_env, "MESHES" if direct_mesh else "EXPORT",
+                                                transfer_path, filepath)
+                if worker_ok and _file_size(filepath) == 0:
+                    logger.error(f"Target 3ds Max file not created or empty: {filepath}")
+                    worker_ok = False
+                if worker_ok is False:
+                    self.report({'ERROR'}, f"3ds Max worker failed to export the file. See log: {log_file}")
+                    return {'CANCELLED'}
+                if worker_ok is None:
+                    max_process = self._launch_max_export(max_python_path, run_env, temp_dir, filepath)
+                    if max_process is None:
+                        return {'CANCELLED'}
+
+            if max_process is not None:
+                # Let the already running 3ds Max pick up the FBX
+                open(ready_flag, 'w').close()
+                if not self._finish_max_export(max_process, filepath):
+                    return {'CANCELLED'}
+
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
         logger.info(f"Export to 3ds Max file completed: {filepath}")
         self.report({'INFO'}, f"Exported successfully to: {filepath}")
         return {'FINISHED'}
     
-    def _generate_simple_script(self, fbx_path, target_path):
-        """Generate simple Python script to call MAXScript"""
-        return f"""
-import os
-import sys
-import subprocess
-import tempfile
-
-def print_and_flush(message):
-    print(message)
-    sys.stdout.flush()
-    sys.stderr.flush()
-
-print_and_flush("[MAX_EXPORT_LOG] 3ds Max Script Start (Export Process)")
-
-fbx_to_import = r"{fbx_path}"
-target_max_file = r"{target_path}"
-
-print_and_flush(f"[MAX_EXPORT_LOG] Processing FBX: {{fbx_to_import}}")
-
-if not os.path.exists(fbx_to_import):
-    print_and_flush(f"[MAX_EXPORT_ERROR] FBX file not found: {{fbx_to_import}}")
-    sys.exit(1)
-
-try:
-    # Find 3dsmaxbatch.exe from Python path
-    max_python_dir = os.path.dirname(sys.executable)
-    max_root = os.path.dirname(max_python_dir)
-    max_batch = os.path.join(max_root, "3dsmaxbatch.exe")
-    
-    if not os.path.exists(max_batch):
-        print_and_flush(f"[MAX_EXPORT_ERROR] 3dsmaxbatch.exe not found at: {{max_batch}}")
-        sys.exit(1)
+    def _export_paths(self, temp_dir):
+        """Intermediate FBX, direct mesh file and ready flag inside an export work folder"""
+        return (os.path.join(temp_dir, "temp_export.fbx"),
+                os.path.join(temp_dir, "temp_export.mesh"),
+                # 3ds Max waits for this before touching the FBX
+                os.path.join(temp_dir, "fbx_ready.flag"))
     
-    print_and_flush(f"[MAX_EXPORT_LOG] Using 3dsmaxbatch.exe: {{max_batch}}")
-    
-    # Create MaxScript content
-    maxscript_content = '''
-resetMaxFile #noPrompt
-importFile @"''' + fbx_to_import.replace(os.sep, '/') + '''" #noPrompt
-saveMaxFile @"''' + target_max_file.replace(os.sep, '/') + '''" quiet:true
-quitMax exitCode:0
-'''
-    
-    # Write temporary MaxScript file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.ms', delete=False, encoding='utf-8') as f:
-        f.write(maxscript_content)
-        script_path = f.name
+    def _capture_selection(self):
+        """Selection state for _restore_selection, by name so the restore never touches stale RNA pointers"""
+        original_active = bpy.context.view_layer.objects.active
+        return ([obj.name for obj in bpy.context.selected_objects],
+                original_active.name if original_active else None,
+                # Hash lookups instead of scanning the view layer for every membership test
+                set(bpy.context.view_layer.objects.keys()))
     
-    print_and_flush(f"[MAX_EXPORT_LOG] Created MaxScript: {{script_path}}")
+    def _select_export_objects(self, selection, export_types):
+        """Leave exactly the objects matching the export filters selected and return them"""
+        selection_names, _, vl_names = selection
+        layer_objects = bpy.context.view_layer.objects
+        # Filter in one pass, cheapest test first. The selection was captured before
+        # deselecting and always belongs to the view layer; scene objects may not.
+        if self.use_selection:
+            export_objects = [obj for obj in map(layer_objects.get, selection_names)
+                              if obj and obj.type in export_types]
+        else:
+            export_objects = [obj for obj in bpy.context.scene.objects
+                              if obj.type in export_types and obj.name in vl_names]
+        
+        _deselect_all(bpy.context)
+        # Everything is already deselected, so only matching objects need an RNA write
+        for obj in export_objects:
+            obj.select_set(True)
+        return export_objects
     
-    try:
-        # Execute 3dsmaxbatch with the script
-        result = subprocess.run([max_batch, script_path], 
-                              capture_output=True, text=True, encoding='utf-8', timeout=300)
+    def _write_intermediate(self, context, export_objects, export_types, fbx_path, mesh_path):
+        """Write the selected objects for 3ds Max; returns (path written, whether it is a direct mesh file)"""
+        # Plain static meshes can skip the FBX round trip entirely
+        direct_mesh = self.direct_mesh_transfer and not self.export_animations and \
+            all(obj.type == 'MESH' for obj in export_objects)
+        if self.direct_mesh_transfer and not direct_mesh:
+            logger.info("Direct Mesh Transfer needs static mesh objects only; using FBX.")
         
-        print_and_flush(f"[MAX_EXPORT_LOG] 3dsmaxbatch executed with return code: {{result.returncode}}")
+        if direct_mesh:
+            logger.info(f"Writing {len(export_objects)} meshes for direct transfer to: {mesh_path}")
+            self._write_mesh_transfer(context, export_objects, mesh_path)
+            transfer_path = mesh_path
+        else:
+            logger.info(f"Exporting {len(export_objects)} objects to FBX based on filters.")
+            bpy.ops.export_scene.fbx(**self._fbx_export_options(fbx_path, export_types))
+            transfer_path = fbx_path
         
-        if result.stdout:
-            print_and_flush(f"[MAX_EXPORT_LOG] STDOUT: {{result.stdout}}")
-        if result.stderr:
-            print_and_flush(f"[MAX_EXPORT_LOG] STDERR: {{result.stderr}}")
+        if _file_size(transfer_path) == 0:
+            raise Exception("Intermediate export failed or resulted in empty file")
+        logger.info("Intermediate export from Blender completed.")
+        return transfer_path, direct_mesh
+    
+    def _finish_max_export(self, max_process, filepath, timeout=300):
+        """Wait for the one-off 3ds Max run to save filepath; reports and returns False on failure"""
+        logger.info("Waiting for 3ds Max to finish the final export.")
+        try:
+            _wait_logged_process(max_process, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._kill_max_process(max_process)
+            logger.error("3dsmaxbatch execution timed out")
+            self.report({'ERROR'}, f"3ds Max export timed out. See log: {log_file}")
+            return False
+        except Exception as e_run_script:
+            logger.error(f"Error running 3ds Max export script: {str(e_run_script)}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            self.report({'ERROR'}, f"Failed to run 3ds Max script. See log: {log_file}")
+            return False
         
-        if os.path.exists(target_max_file) and os.path.getsize(target_max_file) > 0:
-            print_and_flush(f"[MAX_EXPORT_LOG] Successfully exported to 3ds Max (.MAX) format.")
-        else:
-            print_and_flush(f"[MAX_EXPORT_ERROR] Target 3ds Max file not created or empty: {{target_max_file}}")
-            sys.exit(1)
+        if max_process.returncode != 0:
+            logger.error(f"Running 3dsmaxbatch export failed. RC: {max_process.returncode}")
+            self.report({'ERROR'}, f"3ds Max script execution failed (RC: {max_process.returncode}). See log: {log_file}")
+            return False
+        
+        if _file_size(filepath) == 0:
+            logger.error(f"Target 3ds Max file not created or empty: {filepath}")
+            self.report({'ERROR'}, f"3ds Max did not write the exported file. See log: {log_file}")
+            return False
+        return True
     
-    finally:
+    def _restore_selection(self, selection_names, active_name, vl_names):
+        """Reselect objects by name, skipping any that left the view layer"""
+        _deselect_all(bpy.context)
+        layer_objects = bpy.context.view_layer.objects
+        if active_name and active_name in vl_names:
+            layer_objects.active = layer_objects.get(active_name)
+        for name in selection_names:
+            obj = layer_objects.get(name) if name in vl_names else None
+            if obj:
+                obj.select_set(True)
+    
+    def _launch_max_export(self, max_python_path, run_env, temp_dir, filepath, selection=None):
+        """Start the one-off 3dsmaxbatch export. On failure it reports, restores selection if given, and returns None"""
         try:
-            os.unlink(script_path)
-        except:
-            pass
-            
-except subprocess.TimeoutExpired:
-    print_and_flush(f"[MAX_EXPORT_ERROR] 3dsmaxbatch execution timed out")
-    sys.exit(1)
-except Exception as e:
-    print_and_flush(f"[MAX_EXPORT_ERROR] Error during conversion: {{str(e)}}")
-    sys.exit(1)
-
-print_and_flush("[MAX_EXPORT_LOG] 3ds Max Script End (Export Process)")
-"""
+            return self._start_max_export(max_python_path, run_env, temp_dir, filepath)
+        except Exception as e_run_script:
+            logger.error(f"Error running 3ds Max export script: {str(e_run_script)}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            if selection is not None:
+                self._restore_selection(*selection)
+            self.report({'ERROR'}, f"Failed to run 3ds Max script. See log: {log_file}")
+            return None
+    
+    def _start_max_export(self, max_python_path, run_env, temp_dir, filepath):
+        """Launch the one-off 3dsmaxbatch export; it waits for the ready flag before reading the FBX or mesh file"""
+        max_batch = get_max_batch_path(max_python_path)
+        if not os.path.exists(max_batch):
+            raise RuntimeError(f"3dsmaxbatch.exe not found at: {max_batch}")
+        
+        fbx_path, mesh_path, ready_flag = self._export_paths(temp_dir)
+        max_script = self._generate_maxscript(fbx_path, mesh_path, filepath, ready_flag)
+        max_script_path = os.path.join(temp_dir, "blender_to_max_export.ms")
+        _write_bytes(max_script_path, max_script.encode('utf-8'))
 
+        logger.info(f"Starting 3dsmaxbatch for final export: {max_batch} {max_script_path}")
+        return _start_logged_process([max_batch, max_script_path], run_env, "3ds Max Export")
+    
+    def _kill_max_process(self, max_process):
+        """Kill a 3ds Max run that is still waiting for the FBX; it has not touched the target yet"""
+        if max_process is None:
+            return
+        max_process.kill()
+        _wait_logged_process(max_process)
+    
+    def _fbx_export_options(self, fbx_path, export_types):
+        """Keyword arguments for bpy.ops.export_scene.fbx, leaving out work the filters make unnecessary"""
+        object_types = {'EMPTY'} | export_types
+        options = dict(
+            filepath=fbx_path,
+            use_selection=True,  # Always use selection since we've filtered objects
+            global_scale=1.0,
+            apply_unit_scale=True,
+            apply_scale_options='FBX_SCALE_NONE',
+            object_types=object_types,
+            use_mesh_modifiers=self.apply_modifiers,
+            mesh_smooth_type='EDGE',
+            use_subsurf=False,
+            use_mesh_edges=False,
+            use_tspace=False,
+            use_custom_props=False,
+            bake_anim=self.export_animations,
+            path_mode='COPY' if self.copy_textures else 'AUTO',
+            embed_textures=False,
+            batch_mode='OFF',
+            use_metadata=True
+        )
+        if 'ARMATURE' in object_types:
+            options.update(
+                add_leaf_bones=True,
+                primary_bone_axis='Y',
+                secondary_bone_axis='X',
+                use_armature_deform_only=False,
+                armature_nodetype='NULL'
+            )
+        if self.export_animations:
+            # Baking is O(frames x bones); only configure it when animation is exported
+            options.update(
+                bake_anim_use_all_bones=True,
+                bake_anim_use_nla_strips=True,
+                bake_anim_use_all_actions=True,
+                bake_anim_force_startend_keying=True,
+                bake_anim_step=1.0,
+                bake_anim_simplify_factor=1.0
+            )
+        return options
+    
+    def _write_mesh_transfer(self, context, export_objects, mesh_path):
+        """Write world-space triangles of export_objects in the layout read by blenderLoadMeshes"""
+        import numpy as np  # Deferred so loading the addon never pays for numpy
+        depsgraph = context.evaluated_depsgraph_get() if self.apply_modifiers else None
+        unit_scale = context.scene.unit_settings.scale_length
+        with open(mesh_path, 'wb') as f:
+            f.write(np.array([len(export_objects)], dtype=np.int32).tobytes())
+            for obj in export_objects:
+                source = obj.evaluated_get(depsgraph) if depsgraph else obj
+                mesh = source.to_mesh()
+                try:
+                    mesh.transform(source.matrix_world)
+                    mesh.calc_loop_triangles()
+                    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+                    mesh.vertices.foreach_get("co", verts)
+                    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+                    mesh.loop_triangles.foreach_get("vertices", tris)
+                finally:
+                    source.to_mesh_clear()
+                if source.matrix_world.is_negative:
+                    # Mirrored objects would otherwise arrive with inside-out faces
+                    tris = tris.reshape(-1, 3)[:, ::-1].ravel()
+                verts *= unit_scale
+                f.write(obj.name.encode('utf-8') + b'\0')
+                f.write(np.array([len(verts) // 3, len(tris) // 3], dtype=np.int32).tobytes())
+                f.write(verts.tobytes())
+                f.write(tris.tobytes())
+    
+    def _export_object_types(self):
+        """Blender object types selected for export by the current filters"""
+        export_types = set()
+        if self.export_models: export_types.add('MESH')
+        if self.export_lights: export_types.add('LIGHT')
+        if self.export_cameras: export_types.add('CAMERA')
+        if self.export_splines: export_types.add('CURVE')
+        if self.export_models or self.export_animations: export_types.add('ARMATURE')
+        return export_types
+    
+    def _generate_maxscript(self, fbx_path, mesh_path, target_path, ready_flag):
+        """Generate the MAXScript run by 3dsmaxbatch for export
+
+        3ds Max is started once the export filters have matched something and waits
+        for ready_flag, so that its startup overlaps Blender's export. The wait ends
+        early if this Blender process goes away. A mesh file
+        written by Direct Mesh Transfer is loaded instead of the FBX when it exists.
+        """
+        return _MAX_EXPORT_SCRIPT.substitute(
+            fbx_path=_ms_string(fbx_path), mesh_path=_ms_string(mesh_path), target_path=_ms_string(target_path),
+            ready_flag=_ms_string(ready_flag), blender_pid=os.getpid()
+        )
+
+# FBX importer options that never change; filepath and use_anim are passed per call
+_FBX_IMPORT_STATIC = {
+    'global_scale': 1.0,  # Use 1.0 scale, will apply 0.01 scale later
+    'use_custom_normals': True,
+    'use_image_search': True,
+    'use_alpha_decals': False,
+    'decal_offset': 0.0,
+    'anim_offset': 1.0,
+    'use_subsurf': False,
+    'use_custom_props': True,
+    'use_custom_props_enum_as_string': True,
+    'ignore_leaf_bones': False,
+    'force_connect_children': False,
+    'automatic_bone_orientation': False,
+    'primary_bone_axis': 'Y',
+    'secondary_bone_axis': 'X',
+    'use_prepost_rot': True,
+}
 
 class ImportMax(Operator, ImportHelper):
     bl_idname = "import_scene.max"
@@ -590,16 +1247,7 @@ class ImportMax(Operator, ImportHelper):
 
     def invoke(self, context, event):
         # Set defaults from preferences
-        preferences = context.preferences.addons[__name__].preferences
-        self.import_models = preferences.default_import_models
-        self.import_lights = preferences.default_import_lights
-        self.import_cameras = preferences.default_import_cameras
-        self.import_splines = preferences.default_import_splines
-        self.import_animations = preferences.default_import_animations
-        self.import_materials = preferences.default_import_materials
-        self.import_armatures = preferences.default_import_armatures
-        self.apply_rotation = preferences.default_apply_rotation
-        self.apply_scale = preferences.default_apply_scale
+        _apply_import_defaults(self, context.preferences.addons[__name__].preferences)
         return super().invoke(context, event)
 
     def draw(self, context):
@@ -616,6 +1264,7 @@ class ImportMax(Operator, ImportHelper):
         layout.prop(self, "apply_scale")
 
     def execute(self, context):
+        ensure_logging()
         max_file_path = self.filepath
         logger.info(f"Initiating 3ds Max import for: {max_file_path}")
 
@@ -634,137 +1283,107 @@ class ImportMax(Operator, ImportHelper):
         base_name_ext = os.path.basename(max_file_path)
         base_name, _ = os.path.splitext(base_name_ext)
         fbx_file_name = f"blender_max_import_{base_name}.fbx"
-        fbx_file_path = os.path.join(cache_dir, fbx_file_name)
-
-        existing_object_names = {obj.name for obj in bpy.context.scene.objects}
-        
-        max_bin_path = os.path.dirname(max_python_path)
-        max_location = os.path.dirname(max_bin_path)
+        try:
+            fbx_file_path = os.path.join(ensure_cache_dir(), fbx_file_name)
+        except OSError as e:
+            logger.error(f"Could not create cache directory {cache_dir}: {e}")
+            self.report({'ERROR'}, f"Could not create cache directory: {cache_dir}")
+            return {'CANCELLED'}
 
-        max_env = os.environ.copy()
-        max_env["ADSK_3DSMAX_x64_2026"] = max_location
-        max_env["PATH"] = f"{max_bin_path}{os.pathsep}{max_env.get('PATH', '')}"
-        python_site_packages = os.path.join(max_location, 'Python', 'Lib', 'site-packages')
-        if os.path.exists(python_site_packages):
-            max_env["PYTHONPATH"] = f"{python_site_packages}{os.pathsep}{max_env.get('PYTHONPATH', '')}"
-        max_plugin_path = os.path.join(max_location, 'plugins')
-        max_script_path = os.path.join(max_location, 'scripts')
-            
-        max_env["ADSK_3DSMAX_PLUGINS_PATH"] = max_plugin_path
-        max_env["ADSK_3DSMAX_SCRIPTS_PATH"] = max_script_path
-        max_env["PYTHONIOENCODING"] = "UTF-8"
+        max_env = build_max_env(max_python_path)
 
-        # Generate simple import script
-        max_import_script_content = self._generate_simple_import_script(max_file_path, fbx_file_path)
-        
-        temp_script_path = os.path.join(cache_dir, "temp_max_to_fbx_for_blender_import.py")
-        with open(temp_script_path, 'w', encoding='utf-8') as f: f.write(max_import_script_content)
-        
-        logger.info(f"Executing 3ds Max to FBX conversion script: {temp_script_path}")
-        try:
-            result_max = subprocess.run(
-                [max_python_path, temp_script_path], capture_output=True, text=True,
-                encoding='utf-8', env=max_env, check=False
-            )
-            s_out = result_max.stdout.strip() if result_max.stdout else ""
-            s_err = result_max.stderr.strip() if result_max.stderr else ""
-            if s_out: logger.info(f"3ds Max->FBX Script STDOUT:\n{s_out}")
-            if s_err: logger.error(f"3ds Max->FBX Script STDERR:\n{s_err}")
-
-            if result_max.returncode != 0:
-                logger.error(f"3ds Max to FBX script failed. RC: {result_max.returncode}")
-                self.report({'ERROR'}, f"3ds Max conversion failed (RC: {result_max.returncode}). See log: {log_file}")
+        # Pre-import object names for filtering; the scene cannot change while this operator runs
+        existing_object_names = None
+        worker_ok = None
+        if preferences.keep_max_running:
+            logger.info("Converting 3ds Max file to FBX in the persistent 3ds Max worker.")
+            worker_ok = _run_max_worker_job(max_python_path, max_env, "IMPORT", max_file_path, fbx_file_path)
+            if worker_ok is False:
+                self.report({'ERROR'}, f"3ds Max worker failed to convert the file. See log: {log_file}")
                 return {'CANCELLED'}
 
-        except Exception as e:
-            logger.error(f"Failed to execute 3ds Max script: {str(e)}\n{traceback.format_exc()}")
-            self.report({'ERROR'}, f"Failed to execute 3ds Max script: {str(e)}. See log: {log_file}")
-            return {'CANCELLED'}
+        if worker_ok is None:
+            try:
+                launcher_path = get_import_launcher_path()
+                logger.info(f"Executing 3ds Max to FBX conversion script: {launcher_path}")
+                max_process = _start_logged_process(
+                    [max_python_path, launcher_path, max_file_path, fbx_file_path], max_env, "3ds Max->FBX"
+                )
+                # Do the Blender-side preparation while 3ds Max converts the file
+                existing_object_names = set(bpy.context.scene.objects.keys())
+                return_code = _wait_logged_process(max_process)
+                if return_code != 0:
+                    logger.error(f"3ds Max to FBX script failed. RC: {return_code}")
+                    self.report({'ERROR'}, f"3ds Max conversion failed (RC: {return_code}). See log: {log_file}")
+                    return {'CANCELLED'}
+
+            except Exception as e:
+                logger.error(f"Failed to execute 3ds Max script: {str(e)}\n{traceback.format_exc()}")
+                self.report({'ERROR'}, f"Failed to execute 3ds Max script: {str(e)}. See log: {log_file}")
+                return {'CANCELLED'}
 
         # Import the FBX file into Blender
-        if not os.path.exists(fbx_file_path):
-            self.report({'ERROR'}, f"FBX conversion failed: {fbx_file_path} not found")
+        if _file_size(fbx_file_path) == 0:
+            self.report({'ERROR'}, f"FBX conversion failed: {fbx_file_path} not found or empty")
             return {'CANCELLED'}
 
         try:
             logger.info(f"Importing generated FBX into Blender: {fbx_file_path}")
-            bpy.ops.object.select_all(action='DESELECT')
-            
-            # Remember pre-import object names for filtering
-            existing_object_names = {obj.name for obj in bpy.context.scene.objects}
+            _deselect_all(bpy.context)
+            if existing_object_names is None:
+                existing_object_names = set(bpy.context.scene.objects.keys())
+            object_count_before = len(bpy.context.scene.objects)
             
             # Import FBX
-            bpy.ops.import_scene.fbx(
-                filepath=fbx_file_path,
-                global_scale=1.0,  # Use 1.0 scale, will apply 0.01 scale later
-                use_custom_normals=True,
-                use_image_search=True,
-                use_alpha_decals=False,
-                decal_offset=0.0,
-                use_anim=self.import_animations,
-                anim_offset=1.0,
-                use_subsurf=False,
-                use_custom_props=True,
-                use_custom_props_enum_as_string=True,
-                ignore_leaf_bones=False,
-                force_connect_children=False,
-                automatic_bone_orientation=False,
-                primary_bone_axis='Y',
-                secondary_bone_axis='X',
-                use_prepost_rot=True
-            )
+            bpy.ops.import_scene.fbx(filepath=fbx_file_path, use_anim=self.import_animations, **_FBX_IMPORT_STATIC)
             logger.info("FBX imported into Blender.")
 
             # Get imported objects
-            imported_objects = {obj for obj in bpy.context.scene.objects if obj.name not in existing_object_names}
+            # The importer leaves exactly its new objects selected; trust that when the counts agree.
+            # scene.objects is not ordered by creation, so slicing its tail would not be safe.
+            imported_objects = set(bpy.context.selected_objects)
+            if len(imported_objects) != len(bpy.context.scene.objects) - object_count_before:
+                # Some new objects are not selectable (e.g. excluded collections); diff names instead
+                imported_objects = {obj for obj in bpy.context.scene.objects if obj.name not in existing_object_names}
             logger.info(f"Identified {len(imported_objects)} newly imported Blender objects.")
 
             if imported_objects:
-                bpy.ops.object.select_all(action='DESELECT')
-                active_set = False
-                for obj in imported_objects:
-                    obj.select_set(True)
-                    if not active_set:
-                        bpy.context.view_layer.objects.active = obj
-                        active_set = True
-                
-                # Apply rotation if requested
-                if self.apply_rotation:
-                    for obj in imported_objects:
-                        obj.rotation_euler.x = 3.14159  # 180 degrees = π radians
-                    logger.info("Applied X-axis 180 degree rotation.")
-                
-                # Apply 0.01 scale (shrink by 100x) to all imported objects if requested
-                if self.apply_scale:
-                    for obj in imported_objects:
-                        obj.scale = (0.01, 0.01, 0.01)
-                    logger.info("Applied 0.01 scale (shrunk by 100x).")
-                
-                bpy.ops.object.select_all(action='DESELECT')
-
                 # Asset Filtering - similar to Maya plugin structure
+                # Bucket once by type and decide what goes before writing anything to Blender data
+                buckets = self._bucket_by_type(imported_objects)
                 processed_for_deletion = set()
-                if not self.import_models: 
-                    processed_for_deletion.update(self._filter_objects_by_type(imported_objects, 'MESH', keep=False))
-                if not self.import_lights: 
-                    processed_for_deletion.update(self._filter_objects_by_type(imported_objects, 'LIGHT', keep=False))
-                if not self.import_cameras: 
-                    processed_for_deletion.update(self._filter_objects_by_type(imported_objects, 'CAMERA', keep=False))
-                if not self.import_splines: 
-                    processed_for_deletion.update(self._filter_objects_by_type(imported_objects, 'CURVE', keep=False))
+                if not self.import_models: processed_for_deletion |= buckets.get('MESH', set())
+                if not self.import_lights: processed_for_deletion |= buckets.get('LIGHT', set())
+                if not self.import_cameras: processed_for_deletion |= buckets.get('CAMERA', set())
+                if not self.import_splines: processed_for_deletion |= buckets.get('CURVE', set())
                 # Consider Armatures with models:
                 if not self.import_armatures:
-                    processed_for_deletion.update(self._filter_objects_by_type(imported_objects, 'ARMATURE', keep=False))
+                    processed_for_deletion |= buckets.get('ARMATURE', set())
                 elif not self.import_models and self.import_animations:
                     logger.info("Models are off, but animations are on. Armatures will be kept if present.")
-
                 remaining_after_deletion = imported_objects - processed_for_deletion
-                if not self.import_animations and remaining_after_deletion:
-                    self._filter_animations_from_objects(remaining_after_deletion, keep=False)
+
+                # All edits are grouped here with no operator calls in between; Blender
+                # evaluates the depsgraph once afterwards instead of after every step
+                if remaining_after_deletion:
+                    bpy.context.view_layer.objects.active = next(iter(remaining_after_deletion))
+                
+                # Rotation and scale in one pass, skipping objects that are about to be removed
+                apply_rotation = self.apply_rotation
+                apply_scale = self.apply_scale
+                if (apply_rotation or apply_scale) and remaining_after_deletion:
+                    for obj in remaining_after_deletion:
+                        if apply_rotation: obj.rotation_euler.x = 3.14159  # 180 degrees = π radians
+                        if apply_scale: obj.scale = (0.01, 0.01, 0.01)  # Shrink by 100x
+                    if apply_rotation: logger.info("Applied X-axis 180 degree rotation.")
+                    if apply_scale: logger.info("Applied 0.01 scale (shrunk by 100x).")
+
+                self._delete_objects(processed_for_deletion)
+
                 if not self.import_materials and remaining_after_deletion:
                     self._filter_materials_from_objects(remaining_after_deletion, keep=False)
             
-            bpy.ops.object.select_all(action='DESELECT')
+            _deselect_all(bpy.context)
 
             # Clean up FBX file
             try: os.remove(fbx_file_path)
@@ -778,133 +1397,29 @@ class ImportMax(Operator, ImportHelper):
             self.report({'ERROR'}, f"FBX import failed: {str(e)}. See log: {log_file}")
             return {'CANCELLED'}
 
-    def _filter_objects_by_type(self, objects_to_check, obj_type, keep=True):
-        bpy.ops.object.select_all(action='DESELECT')
-        targeted_objects = set()
-        for obj in objects_to_check:
-            if obj and obj.name in bpy.context.scene.objects and obj.type == obj_type:
-                obj.select_set(True)
-                targeted_objects.add(obj)
-        
-        if not keep and targeted_objects:
-            logger.info(f"Filtering: Deleting {len(targeted_objects)} objects of type {obj_type}.")
-            bpy.ops.object.delete()
-            return targeted_objects # Return what was deleted
-        elif keep and targeted_objects:
-             logger.info(f"Filtering: Keeping {len(targeted_objects)} objects of type {obj_type}.")
-        bpy.ops.object.select_all(action='DESELECT')
-        return targeted_objects if not keep else set() # Return deleted if not keep, else empty set
-
-    def _filter_armatures_from_objects(self, objects_to_check, keep=True):
-        if not keep:
-            cleared_count = 0
-            for obj in objects_to_check:
-                if obj and obj.name in bpy.context.scene.objects and obj.type == 'ARMATURE':
-                    bpy.data.objects.remove(obj)
-                    cleared_count += 1
-            if cleared_count > 0: logger.info(f"Filtering: Removed {cleared_count} armatures.")
+    def _bucket_by_type(self, objects):
+        """Group objects into {obj.type: set of objects} in one traversal"""
+        buckets = {}
+        for obj in objects:
+            buckets.setdefault(obj.type, set()).add(obj)
+        return buckets
 
-    def _filter_animations_from_objects(self, objects_to_check, keep=True):
-        if not keep:
-            cleared_count = 0
-            for obj in objects_to_check:
-                if obj and obj.name in bpy.context.scene.objects and obj.animation_data:
-                    obj.animation_data_clear()
-                    cleared_count += 1
-            if cleared_count > 0: logger.info(f"Filtering: Cleared animation data from {cleared_count} objects.")
+    def _delete_objects(self, objects_to_delete):
+        """Remove object datablocks directly, without selection or the delete operator"""
+        if not objects_to_delete:
+            return
+        logger.info(f"Filtering: Deleting {len(objects_to_delete)} objects.")
+        bpy.data.batch_remove(ids=list(objects_to_delete))
 
     def _filter_materials_from_objects(self, objects_to_check, keep=True):
         if not keep:
+            # Instanced objects share data; clear each datablock once (ID wrappers hash by pointer)
+            unique_data = {obj.data for obj in objects_to_check
+                           if obj and obj.data and hasattr(obj.data, 'materials')}
             cleared_count = 0
-            for obj in objects_to_check:
-                if obj and obj.name in bpy.context.scene.objects and obj.data and hasattr(obj.data, 'materials'):
-                    if obj.data.materials: obj.data.materials.clear(); cleared_count += 1
-            if cleared_count > 0: logger.info(f"Filtering: Cleared material slots from {cleared_count} objects.")
-    
-    def _generate_simple_import_script(self, max_file_path, fbx_file_path):
-        """Generate simple Python script to call MAXScript for import"""
-        return f"""
-import os
-import sys
-import subprocess
-import tempfile
-
-def print_and_flush(message):
-    print(message)
-    sys.stdout.flush()
-    sys.stderr.flush()
-
-print_and_flush("[MAX_IMPORT_LOG] 3ds Max Script Start (Import Process)")
-
-max_input_path = r"{max_file_path}"
-fbx_output_path = r"{fbx_file_path}"
-
-print_and_flush(f"[MAX_IMPORT_LOG] Source: {{max_input_path}}, Target FBX: {{fbx_output_path}}")
-
-if not os.path.exists(max_input_path):
-    print_and_flush(f"[MAX_IMPORT_ERROR] Input 3ds Max file not found: {{max_input_path}}")
-    sys.exit(1)
-
-try:
-    # Find 3dsmaxbatch.exe from Python path
-    max_python_dir = os.path.dirname(sys.executable)
-    max_root = os.path.dirname(max_python_dir)
-    max_batch = os.path.join(max_root, "3dsmaxbatch.exe")
-    
-    if not os.path.exists(max_batch):
-        print_and_flush(f"[MAX_IMPORT_ERROR] 3dsmaxbatch.exe not found at: {{max_batch}}")
-        sys.exit(1)
-    
-    print_and_flush(f"[MAX_IMPORT_LOG] Using 3dsmaxbatch.exe: {{max_batch}}")
-
-    # Create MAXScript file
-    maxscript_content = '''
-loadMaxFile @"''' + max_input_path.replace(os.sep, '/') + '''" quiet:true
-exportFile @"''' + fbx_output_path.replace(os.sep, '/') + '''" #noPrompt selectedOnly:false
-quitMax exitCode:0
-'''
-
-    # Write temporary MAXScript file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.ms', delete=False, encoding='utf-8') as f:
-        f.write(maxscript_content)
-        script_path = f.name
-    
-    print_and_flush(f"[MAX_IMPORT_LOG] Created MaxScript: {{script_path}}")
-
-    try:
-        # Execute 3dsmaxbatch with the script
-        result = subprocess.run([max_batch, script_path], 
-                              capture_output=True, text=True, encoding='utf-8', timeout=300)
-        
-        print_and_flush(f"[MAX_IMPORT_LOG] 3dsmaxbatch executed with return code: {{result.returncode}}")
-        
-        if result.stdout:
-            print_and_flush(f"[MAX_IMPORT_LOG] STDOUT: {{result.stdout}}")
-        if result.stderr:
-            print_and_flush(f"[MAX_IMPORT_LOG] STDERR: {{result.stderr}}")
-        
-        if os.path.exists(fbx_output_path) and os.path.getsize(fbx_output_path) > 0:
-            file_size = os.path.getsize(fbx_output_path)
-            print_and_flush(f"[MAX_IMPORT_LOG] FBX file exported: {{fbx_output_path}} (Size: {{file_size}} B)")
-        else:
-            print_and_flush(f"[MAX_IMPORT_ERROR] FBX export failed or file is empty: {{fbx_output_path}}")
-            sys.exit(1)
-    
-    finally:
-        try:
-            os.unlink(script_path)
-        except:
-            pass
-            
-except subprocess.TimeoutExpired:
-    print_and_flush(f"[MAX_IMPORT_ERROR] 3dsmaxbatch execution timed out")
-    sys.exit(1)
-except Exception as e:
-    print_and_flush(f"[MAX_IMPORT_ERROR] Error during conversion: {{str(e)}}")
-    sys.exit(1)
-
-print_and_flush("[MAX_IMPORT_LOG] 3ds Max Script End (Import Process)")
-"""
+            for data in unique_data:
+                if data.materials: data.materials.clear(); cleared_count += 1
+            if cleared_count > 0: logger.info(f"Filtering: Cleared material slots from {cleared_count} datablocks.")
 
 
 class InvokeExportMax(Operator):
@@ -920,8 +1435,12 @@ class InvokeExportMax(Operator):
     export_splines: BoolProperty(name="Splines", description="Export curve/spline objects", default=True)
     export_animations: BoolProperty(name="Animations", description="Export animations", default=True)
     use_selection: BoolProperty(name="Selection Only", description="Export selected objects only", default=False)
+    apply_modifiers: BoolProperty(name="Apply Modifiers", description="Apply mesh modifiers to exported geometry (disable for faster export of modifier-free scenes)", default=True)
+    copy_textures: BoolProperty(name="Copy Textures", description="Copy referenced texture files alongside the intermediate FBX", default=True)
+    direct_mesh_transfer: BoolProperty(name="Direct Mesh Transfer", description="Send mesh-only exports without animation to 3ds Max as raw triangles instead of FBX (geometry only, no materials or UVs)", default=False)
 
     def invoke(self, context, event):
+        ensure_logging()
         if not self.filepath:
             self.filepath = "untitled.max"
         logger.info(f"Opening export options dialog for 3ds Max file: {self.filepath}")
@@ -942,6 +1461,9 @@ class InvokeExportMax(Operator):
         
         layout.separator()
         layout.prop(self, "use_selection")
+        layout.prop(self, "apply_modifiers")
+        layout.prop(self, "copy_textures")
+        layout.prop(self, "direct_mesh_transfer")
 
     def execute(self, context):
         logger.info(f"Executing 3ds Max export for: {self.filepath} with options.")
@@ -950,7 +1472,9 @@ class InvokeExportMax(Operator):
                 'EXEC_DEFAULT', filepath=self.filepath,
                 export_models=self.export_models, export_lights=self.export_lights,
                 export_cameras=self.export_cameras, export_splines=self.export_splines,
-                export_animations=self.export_animations, use_selection=self.use_selection
+                export_animations=self.export_animations, use_selection=self.use_selection,
+                apply_modifiers=self.apply_modifiers, copy_textures=self.copy_textures,
+                direct_mesh_transfer=self.direct_mesh_transfer
             )
         except Exception as e:
             logger.error(f"Export options export_scene.max call failed: {e}\n{traceback.format_exc()}")
@@ -976,22 +1500,14 @@ class InvokeImportMax(Operator):
     apply_scale: BoolProperty(name="Apply 0.01 Scale", description="Scale imported objects to 0.01 (shrink by 100x)")
 
     def invoke(self, context, event):
+        ensure_logging()
         if not self.filepath or not os.path.exists(self.filepath) or \
            not self.filepath.lower().endswith(".max"):
             self.report({'ERROR'}, "Invalid 3ds Max file (.max) for drag-and-drop.")
             return {'CANCELLED'}
         
         # Set defaults from preferences
-        preferences = context.preferences.addons[__name__].preferences
-        self.import_models = preferences.default_import_models
-        self.import_lights = preferences.default_import_lights
-        self.import_cameras = preferences.default_import_cameras
-        self.import_splines = preferences.default_import_splines
-        self.import_animations = preferences.default_import_animations
-        self.import_materials = preferences.default_import_materials
-        self.import_armatures = preferences.default_import_armatures
-        self.apply_rotation = preferences.default_apply_rotation
-        self.apply_scale = preferences.default_apply_scale
+        _apply_import_defaults(self, context.preferences.addons[__name__].preferences)
         
         logger.info(f"Drag-and-drop for 3ds Max file: {self.filepath}. Opening options dialog.")
         return context.window_manager.invoke_props_dialog(self)
@@ -1039,28 +1555,31 @@ def menu_func_export(self, context):
 def menu_func_import(self, context):
     self.layout.operator(ImportMax.bl_idname, text="Autodesk 3ds Max (.max)")
 
+CLASSES = (
+    PREFERENCES_OT_detect_max_python,
+    MaxPreferences,
+    ExportMax,
+    ImportMax,
+    InvokeExportMax,
+    InvokeImportMax,
+    ImportMaxFileHandler,
+)
+
 def register():
-    bpy.utils.register_class(PREFERENCES_OT_detect_max_python)
-    bpy.utils.register_class(MaxPreferences)
-    bpy.utils.register_class(ExportMax)
-    bpy.utils.register_class(ImportMax)
-    bpy.utils.register_class(InvokeExportMax)
-    bpy.utils.register_class(InvokeImportMax)
-    bpy.utils.register_class(ImportMaxFileHandler)
+    for cls in CLASSES:
+        bpy.utils.register_class(cls)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
     bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
+    _auto_detect_preferences_path()
+    cleanup_stale_exports()
     logger.info("3ds Max Import/Export Addon registered successfully with new features.")
 
 def unregister():
-    bpy.utils.unregister_class(PREFERENCES_OT_detect_max_python)
-    bpy.utils.unregister_class(MaxPreferences)
-    bpy.utils.unregister_class(ExportMax)
-    bpy.utils.unregister_class(ImportMax)
-    bpy.utils.unregister_class(InvokeExportMax)
-    bpy.utils.unregister_class(InvokeImportMax)
-    bpy.utils.unregister_class(ImportMaxFileHandler)
+    for cls in reversed(CLASSES):
+        bpy.utils.unregister_class(cls)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
+    _stop_max_worker()
     logger.info("3ds Max Import/Export Addon unregistered.")
 
 if __name__ == "__main__":